@@ -0,0 +1,51 @@
+"""
+COSMIC MATHEMATICS KERNELS
+Numeric hot loops, compiled with Numba when it is installed
+"""
+
+import math
+
+import numpy as np
+
+try:
+    import numba as nb
+except ImportError:  # numba is optional; kernels then run as plain Python/NumPy
+    nb = None
+
+
+def _jit(fallback=None):
+    """Compile with an on-disk cache so restarts skip the LLVM build; without numba use fallback (or the function)"""
+
+    def decorate(func):
+        if nb is None:
+            return fallback or func
+        return nb.njit(cache=True, fastmath=True)(func)
+
+    return decorate
+
+
+def _phi_pow_batch_numpy(ns, phi):
+    return np.power(phi, ns)
+
+
+@_jit(fallback=_phi_pow_batch_numpy)
+def phi_pow_batch(ns, phi):
+    """φ^n for each stage in a 1-D float64 array"""
+    out = np.empty(ns.size, dtype=np.float64)
+    for i in range(ns.size):
+        out[i] = phi ** ns[i]
+    return out
+
+
+@_jit()
+def harmonic_sum(omega, t, phi, n_terms):
+    """HÓTÉ harmonic integration: Σ sin(k·ω·t + φ) for k = 1..n_terms"""
+    total = 0.0
+    for k in range(1, n_terms + 1):
+        total += math.sin(k * omega * t + phi)
+    return total
+
+
+def warmup():
+    """Trigger compilation (or cache load) of the kernels the app serves, instead of on the first request"""
+    phi_pow_batch(np.zeros(1, dtype=np.float64), 1.0)
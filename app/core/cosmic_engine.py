@@ -3,11 +3,21 @@ BENKHAWIYA COSMIC REASONING ENGINE
 Professional Implementation for sacredtreeofthephoenix.org
 """
 
+import hashlib
+import json
 import math
-import asyncio
-from typing import Dict, List, Any
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from functools import cached_property
+from typing import Dict, Final, List, NamedTuple, Optional, Tuple, Any
 from enum import Enum
-from pydantic import BaseModel, Field
+
+import numpy as np
+import orjson
+
+from app.core import _kernels
+
+PHI: Final[float] = (1 + math.sqrt(5)) / 2  # Golden Ratio
 
 
 class CouncilAspect(str, Enum):
@@ -16,8 +26,21 @@ class CouncilAspect(str, Enum):
     RUWA = "ruwa"  # Vision, Possibility, Innovation
     TEMU = "temu"  # Structure, Proportion, Manifestation
 
+    def __init__(self, value: str):
+        # Label used in council output; a plain member attribute avoids re-uppercasing per call
+        self.upper_name = value.upper()
+
 
-class CosmicPrinciple(BaseModel):
+# Iterating a tuple is cheaper than going through EnumMeta.__iter__ on every call
+_ALL_ASPECTS: Tuple[CouncilAspect, ...] = tuple(CouncilAspect)
+_ASPECT_COUNT = len(_ALL_ASPECTS)
+# Static per-aspect prefixes of the decision summary and action lines
+_DECISION_PREFIXES: Dict[CouncilAspect, str] = {aspect: f"{aspect.upper_name}: " for aspect in _ALL_ASPECTS}
+_ACTION_PREFIXES: Dict[CouncilAspect, str] = {aspect: f"Apply {aspect.value} wisdom: " for aspect in _ALL_ASPECTS}
+
+
+@dataclass(slots=True, frozen=True)
+class CosmicPrinciple:
     id: int
     name: str
     meaning: str
@@ -27,507 +50,585 @@ class CosmicPrinciple(BaseModel):
     practical_application: str
 
 
-class CouncilPerspective(BaseModel):
+@dataclass(slots=True, frozen=True)
+class CouncilPerspective:
     aspect: CouncilAspect
     perspective: str
     reasoning: str
     recommendation: str
-    principles_applied: List[str]
-    coherence_score: float = Field(ge=0, le=1)
+    principles_applied: Tuple[str, ...]
+    coherence_score: float
+
+    def __post_init__(self):
+        # Only the engine builds perspectives, so the 0..1 bound is a debug check (stripped by python -O)
+        assert 0 <= self.coherence_score <= 1, "coherence_score must be within [0, 1]"  # nosec B101
+
 
+class AspectFramework(NamedTuple):
+    focus: Tuple[str, ...]
+    questions: Tuple[str, ...]
+    weight: float
 
-class CosmicDecision(BaseModel):
+
+@dataclass(slots=True, frozen=True)
+class CosmicDecision:
     integrated_decision: str
     council_perspectives: Dict[CouncilAspect, CouncilPerspective]
     consensus_level: float
     cosmic_coherence: float
-    recommended_actions: List[str]
+    recommended_actions: Tuple[str, ...]
     developmental_stage: int
 
 
+# 42 Ka Cube Principles - built once at import and shared by every engine
+_PRINCIPLES: Tuple[CosmicPrinciple, ...] = (
+    # PELU Principles (Truth, Boundaries, Integrity) - 11 principles
+    CosmicPrinciple(
+        id=1,
+        name="DÁNÁ",
+        meaning="Truth Alignment",
+        description="Fundamental reality alignment and cosmic truth measurement",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="A_truth = ∇·Ψ_cosmic",
+        practical_application="Reality verification and truth discernment",
+    ),
+    CosmicPrinciple(
+        id=2,
+        name="KÉLÚ",
+        meaning="Boundary Clarity",
+        description="Clear delineation of sacred boundaries and limits",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="∂Ω/∂t = 0",
+        practical_application="Setting healthy boundaries and limits",
+    ),
+    CosmicPrinciple(
+        id=3,
+        name="SÉTÁ",
+        meaning="Precision Measurement",
+        description="Accurate measurement and assessment of reality",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="ε_measure → 0",
+        practical_application="Data-driven decision making",
+    ),
+    CosmicPrinciple(
+        id=4,
+        name="WÉNÁ",
+        meaning="Integrity Shield",
+        description="Protection and maintenance of wholeness and authenticity",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="∮ integrity·dl = 1",
+        practical_application="Maintaining ethical standards",
+    ),
+    CosmicPrinciple(
+        id=5,
+        name="PÉKÁ",
+        meaning="Discernment Light",
+        description="Clear seeing and wise judgment of situations",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="L_discern = ∫clarity·dλ",
+        practical_application="Critical thinking and analysis",
+    ),
+    CosmicPrinciple(
+        id=6,
+        name="RÉNÁ",
+        meaning="Truth Resonance",
+        description="Vibrational alignment with fundamental truth",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="ω_truth ≈ ω_reality",
+        practical_application="Authenticity in communication",
+    ),
+    CosmicPrinciple(
+        id=7,
+        name="TÉLÚ",
+        meaning="Test Validation",
+        description="Verification through rigorous testing",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="P(valid|test) → 1",
+        practical_application="Quality assurance processes",
+    ),
+    CosmicPrinciple(
+        id=8,
+        name="MÉKÁ",
+        meaning="Standard Calibration",
+        description="Alignment with universal standards and measures",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="x_actual = x_standard",
+        practical_application="Standardization and consistency",
+    ),
+    CosmicPrinciple(
+        id=9,
+        name="DÉWÁ",
+        meaning="Honesty Core",
+        description="Foundation of truthful expression and transparency",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="H = -Σp·log(p)",
+        practical_application="Transparent communication",
+    ),
+    CosmicPrinciple(
+        id=10,
+        name="LÉNÁ",
+        meaning="Law Harmony",
+        description="Alignment with natural and cosmic law",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="∇×E = -∂B/∂t",
+        practical_application="Legal and ethical compliance",
+    ),
+    CosmicPrinciple(
+        id=11,
+        name="NÉKÁ",
+        meaning="Clarity Beacon",
+        description="Illumination of truth in darkness",
+        council_aspect=CouncilAspect.PELU,
+        mathematical_representation="I = I₀e^(-μx)",
+        practical_application="Clear documentation and teaching",
+    ),
+    # TEMU Principles (Structure, Proportion, Timing) - 11 principles
+    CosmicPrinciple(
+        id=12,
+        name="MÁTÁ",
+        meaning="Justice Balance",
+        description="Right relationship and cosmic balance maintenance",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="A_justice = ∫balance·dΩ",
+        practical_application="Fairness and equitable distribution",
+    ),
+    CosmicPrinciple(
+        id=13,
+        name="FÍSÁ",
+        meaning="Golden Proportion",
+        description="Divine proportion and harmonic ratios in manifestation",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="φ = (1+√5)/2",
+        practical_application="Aesthetic and functional design",
+    ),
+    CosmicPrinciple(
+        id=14,
+        name="RÍTÁ",
+        meaning="Sacred Timing",
+        description="Perfect timing and synchronization with cosmic cycles",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="t_optimal = Φ(cycle)",
+        practical_application="Project planning and scheduling",
+    ),
+    CosmicPrinciple(
+        id=15,
+        name="SÍMÁ",
+        meaning="Symmetry Order",
+        description="Balanced structure and mirrored harmony",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="S(x) = S(-x)",
+        practical_application="Organizational structure design",
+    ),
+    CosmicPrinciple(
+        id=16,
+        name="KRÍÁ",
+        meaning="Crystalline Matrix",
+        description="Perfect geometric structure and lattice formation",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="A·B = 0",
+        practical_application="Systems architecture",
+    ),
+    CosmicPrinciple(
+        id=17,
+        name="BÓNÁ",
+        meaning="Foundation Strength",
+        description="Solid base and structural integrity",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="σ_max < σ_yield",
+        practical_application="Infrastructure development",
+    ),
+    CosmicPrinciple(
+        id=18,
+        name="DRÍÁ",
+        meaning="Distribution Flow",
+        description="Optimal resource allocation and flow",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="∇·F = ρ",
+        practical_application="Resource management",
+    ),
+    CosmicPrinciple(
+        id=19,
+        name="KÓNÁ",
+        meaning="Sacred Geometry",
+        description="Divine patterns in form and structure",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="V = ∫∫∫ dV",
+        practical_application="Spatial planning",
+    ),
+    CosmicPrinciple(
+        id=20,
+        name="TRÍÁ",
+        meaning="Threefold Unity",
+        description="Trinity principle in manifestation",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="Ψ = ψ₁ + ψ₂ + ψ₃",
+        practical_application="Three-pillar frameworks",
+    ),
+    CosmicPrinciple(
+        id=21,
+        name="MÉNÁ",
+        meaning="Measure Exactness",
+        description="Precise quantification and metrics",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="Δx·Δp ≥ ℏ/2",
+        practical_application="Performance measurement",
+    ),
+    CosmicPrinciple(
+        id=22,
+        name="ÁRÍÁ",
+        meaning="Hierarchical Order",
+        description="Natural ordering and stratification",
+        council_aspect=CouncilAspect.TEMU,
+        mathematical_representation="E₀ < E₁ < E₂ < ...",
+        practical_application="Organizational hierarchy",
+    ),
+    # SEWU Principles (Nurturing, Connection, Community) - 10 principles
+    CosmicPrinciple(
+        id=23,
+        name="HÓTÉ",
+        meaning="Harmonic Integration",
+        description="Coherent integration of diverse elements into unified whole",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="A_harmony = Σ(sin(ωt + φ))",
+        practical_application="Conflict resolution and relationship harmony",
+    ),
+    CosmicPrinciple(
+        id=24,
+        name="LÚVÁ",
+        meaning="Love Resonance",
+        description="Vibrational frequency of unconditional love",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="L(r) = k/r²",
+        practical_application="Compassionate relationships",
+    ),
+    CosmicPrinciple(
+        id=25,
+        name="ÚNÍÁ",
+        meaning="Unity Consciousness",
+        description="Recognition of interconnectedness of all being",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="Ψ_collective = ⨂Ψᵢ",
+        practical_application="Community building",
+    ),
+    CosmicPrinciple(
+        id=26,
+        name="KÁRÉ",
+        meaning="Care Nurturing",
+        description="Tender attention and supportive growth",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="dG/dt = r·G·(1-G/K)",
+        practical_application="Mentorship and support",
+    ),
+    CosmicPrinciple(
+        id=27,
+        name="ÉMÚÁ",
+        meaning="Empathy Bridge",
+        description="Deep understanding and emotional resonance",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="E_shared = ∫ψ₁*·ψ₂ dτ",
+        practical_application="Active listening",
+    ),
+    CosmicPrinciple(
+        id=28,
+        name="SHÁNÁ",
+        meaning="Sharing Flow",
+        description="Generous circulation of resources and wisdom",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="∮ J·dA = 0",
+        practical_application="Knowledge sharing",
+    ),
+    CosmicPrinciple(
+        id=29,
+        name="HÍLÁ",
+        meaning="Healing Presence",
+        description="Restorative energy and therapeutic power",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="H(t) = H₀·e^(-λt)",
+        practical_application="Healing practices",
+    ),
+    CosmicPrinciple(
+        id=30,
+        name="GRÁWÁ",
+        meaning="Growth Cultivation",
+        description="Organic development and evolutionary progress",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="∂u/∂t = D∇²u",
+        practical_application="Personal development",
+    ),
+    CosmicPrinciple(
+        id=31,
+        name="PÉWÁ",
+        meaning="Peace Stillness",
+        description="Tranquil center and harmonious equilibrium",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="∇V = 0",
+        practical_application="Meditation and calm",
+    ),
+    CosmicPrinciple(
+        id=32,
+        name="JÓYÁ",
+        meaning="Joy Radiance",
+        description="Light emanation of happiness and celebration",
+        council_aspect=CouncilAspect.SEWU,
+        mathematical_representation="J = σT⁴",
+        practical_application="Positive environment",
+    ),
+    # RUWA Principles (Vision, Possibility, Innovation) - 10 principles
+    CosmicPrinciple(
+        id=33,
+        name="VÍSÁ",
+        meaning="Vision Sight",
+        description="Clear perception of future possibilities",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="V(future) = ∫P(t)·dt",
+        practical_application="Strategic planning",
+    ),
+    CosmicPrinciple(
+        id=34,
+        name="CRÉÁ",
+        meaning="Creative Force",
+        description="Generative power of imagination and innovation",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="C = ∂Ψ/∂imagination",
+        practical_application="Innovation and creativity",
+    ),
+    CosmicPrinciple(
+        id=35,
+        name="ÉXPÁ",
+        meaning="Expansion Wave",
+        description="Outward growth and boundary transcendence",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="r(t) = r₀·e^(Ht)",
+        practical_application="Market expansion",
+    ),
+    CosmicPrinciple(
+        id=36,
+        name="TRÁNÁ",
+        meaning="Transformation Alchemy",
+        description="Fundamental change and metamorphosis",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="A → B: ΔG < 0",
+        practical_application="Change management",
+    ),
+    CosmicPrinciple(
+        id=37,
+        name="INSÁ",
+        meaning="Insight Flash",
+        description="Sudden illumination and epiphany",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="I(t) = I₀·δ(t-t₀)",
+        practical_application="Breakthrough thinking",
+    ),
+    CosmicPrinciple(
+        id=38,
+        name="PÓSSÁ",
+        meaning="Possibility Field",
+        description="Quantum potential and multiple futures",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="Ψ = Σcᵢ|ψᵢ⟩",
+        practical_application="Scenario planning",
+    ),
+    CosmicPrinciple(
+        id=39,
+        name="IMÁGÁ",
+        meaning="Imagination Power",
+        description="Mental creation and visualization strength",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="I·V = Reality",
+        practical_application="Visioning exercises",
+    ),
+    CosmicPrinciple(
+        id=40,
+        name="NÓVÁ",
+        meaning="Innovation Spark",
+        description="Novel combination and inventive solutions",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="N = recombine(A,B)",
+        practical_application="Product development",
+    ),
+    CosmicPrinciple(
+        id=41,
+        name="FÓRÉÁ",
+        meaning="Foresight Wisdom",
+        description="Anticipatory knowledge and prophetic vision",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="F(t+Δt) = f(state,t)",
+        practical_application="Risk assessment",
+    ),
+    CosmicPrinciple(
+        id=42,
+        name="ÉVÓÁ",
+        meaning="Evolution Drive",
+        description="Progressive development toward higher complexity",
+        council_aspect=CouncilAspect.RUWA,
+        mathematical_representation="dΩ/dt > 0",
+        practical_application="Continuous improvement",
+    ),
+)
+
+# Professional Aspect Frameworks
+_ASPECT_FRAMEWORKS: Dict[CouncilAspect, AspectFramework] = {
+    CouncilAspect.SEWU: AspectFramework(
+        focus=("nurturing", "connection", "emotional_intelligence", "community"),
+        questions=(
+            "How does this nurture growth and relationships?",
+            "What connections need cultivation?",
+            "How does this affect communal harmony?",
+        ),
+        weight=0.25,
+    ),
+    CouncilAspect.PELU: AspectFramework(
+        focus=("truth", "boundaries", "integrity", "measurement"),
+        questions=(
+            "What is the fundamental truth here?",
+            "What boundaries ensure integrity?",
+            "How do we measure accuracy and alignment?",
+        ),
+        weight=0.25,
+    ),
+    CouncilAspect.RUWA: AspectFramework(
+        focus=("vision", "possibility", "innovation", "perspective"),
+        questions=(
+            "What future possibilities does this reveal?",
+            "How can perspective be expanded?",
+            "What visionary paths are available?",
+        ),
+        weight=0.25,
+    ),
+    CouncilAspect.TEMU: AspectFramework(
+        focus=("structure", "proportion", "timing", "manifestation"),
+        questions=(
+            "What structural integrity is needed?",
+            "How is cosmic proportion maintained?",
+            "What is the optimal timing for manifestation?",
+        ),
+        weight=0.25,
+    ),
+}
+
+
+# Upper bound on memoised consultations kept per engine
+_DECISION_CACHE_SIZE = 1024
+
+
+def _detach(decision: CosmicDecision) -> CosmicDecision:
+    # Cached decisions are shared; give each caller its own perspectives dict (everything else is immutable)
+    return replace(decision, council_perspectives=dict(decision.council_perspectives))
+
+
+def _context_digest(context: Dict[str, Any]) -> bytes:
+    return hashlib.blake2b(json.dumps(context, sort_keys=True).encode(), digest_size=16).digest()
+
+
+# φ^n for every stage the API accepts (0..100), so those lookups skip the float pow
+_PHI_POWERS: Tuple[float, ...] = tuple(math.pow(PHI, n) for n in range(101))
+
+
 class BenkhawiyaEngine:
     """Professional Cosmic Reasoning Implementation"""
 
     def __init__(self):
-        self.phi = (1 + math.sqrt(5)) / 2  # Golden Ratio
+        self.phi = PHI
         self.pi = math.pi
-        self.principles = self._initialize_cosmic_principles()
-        self.aspect_frameworks = self._initialize_aspect_frameworks()
-
-    def _initialize_cosmic_principles(self) -> List[CosmicPrinciple]:
-        """42 Ka Cube Principles - Professional Implementation"""
-        return [
-            # PELU Principles (Truth, Boundaries, Integrity) - 11 principles
-            CosmicPrinciple(
-                id=1,
-                name="DÁNÁ",
-                meaning="Truth Alignment",
-                description="Fundamental reality alignment and cosmic truth measurement",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="A_truth = ∇·Ψ_cosmic",
-                practical_application="Reality verification and truth discernment",
-            ),
-            CosmicPrinciple(
-                id=2,
-                name="KÉLÚ",
-                meaning="Boundary Clarity",
-                description="Clear delineation of sacred boundaries and limits",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="∂Ω/∂t = 0",
-                practical_application="Setting healthy boundaries and limits",
-            ),
-            CosmicPrinciple(
-                id=3,
-                name="SÉTÁ",
-                meaning="Precision Measurement",
-                description="Accurate measurement and assessment of reality",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="ε_measure → 0",
-                practical_application="Data-driven decision making",
-            ),
-            CosmicPrinciple(
-                id=4,
-                name="WÉNÁ",
-                meaning="Integrity Shield",
-                description="Protection and maintenance of wholeness and authenticity",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="∮ integrity·dl = 1",
-                practical_application="Maintaining ethical standards",
-            ),
-            CosmicPrinciple(
-                id=5,
-                name="PÉKÁ",
-                meaning="Discernment Light",
-                description="Clear seeing and wise judgment of situations",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="L_discern = ∫clarity·dλ",
-                practical_application="Critical thinking and analysis",
-            ),
-            CosmicPrinciple(
-                id=6,
-                name="RÉNÁ",
-                meaning="Truth Resonance",
-                description="Vibrational alignment with fundamental truth",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="ω_truth ≈ ω_reality",
-                practical_application="Authenticity in communication",
-            ),
-            CosmicPrinciple(
-                id=7,
-                name="TÉLÚ",
-                meaning="Test Validation",
-                description="Verification through rigorous testing",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="P(valid|test) → 1",
-                practical_application="Quality assurance processes",
-            ),
-            CosmicPrinciple(
-                id=8,
-                name="MÉKÁ",
-                meaning="Standard Calibration",
-                description="Alignment with universal standards and measures",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="x_actual = x_standard",
-                practical_application="Standardization and consistency",
-            ),
-            CosmicPrinciple(
-                id=9,
-                name="DÉWÁ",
-                meaning="Honesty Core",
-                description="Foundation of truthful expression and transparency",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="H = -Σp·log(p)",
-                practical_application="Transparent communication",
-            ),
-            CosmicPrinciple(
-                id=10,
-                name="LÉNÁ",
-                meaning="Law Harmony",
-                description="Alignment with natural and cosmic law",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="∇×E = -∂B/∂t",
-                practical_application="Legal and ethical compliance",
-            ),
-            CosmicPrinciple(
-                id=11,
-                name="NÉKÁ",
-                meaning="Clarity Beacon",
-                description="Illumination of truth in darkness",
-                council_aspect=CouncilAspect.PELU,
-                mathematical_representation="I = I₀e^(-μx)",
-                practical_application="Clear documentation and teaching",
-            ),
-            # TEMU Principles (Structure, Proportion, Timing) - 11 principles
-            CosmicPrinciple(
-                id=12,
-                name="MÁTÁ",
-                meaning="Justice Balance",
-                description="Right relationship and cosmic balance maintenance",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="A_justice = ∫balance·dΩ",
-                practical_application="Fairness and equitable distribution",
-            ),
-            CosmicPrinciple(
-                id=13,
-                name="FÍSÁ",
-                meaning="Golden Proportion",
-                description="Divine proportion and harmonic ratios in manifestation",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="φ = (1+√5)/2",
-                practical_application="Aesthetic and functional design",
-            ),
-            CosmicPrinciple(
-                id=14,
-                name="RÍTÁ",
-                meaning="Sacred Timing",
-                description="Perfect timing and synchronization with cosmic cycles",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="t_optimal = Φ(cycle)",
-                practical_application="Project planning and scheduling",
-            ),
-            CosmicPrinciple(
-                id=15,
-                name="SÍMÁ",
-                meaning="Symmetry Order",
-                description="Balanced structure and mirrored harmony",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="S(x) = S(-x)",
-                practical_application="Organizational structure design",
-            ),
-            CosmicPrinciple(
-                id=16,
-                name="KRÍÁ",
-                meaning="Crystalline Matrix",
-                description="Perfect geometric structure and lattice formation",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="A·B = 0",
-                practical_application="Systems architecture",
-            ),
-            CosmicPrinciple(
-                id=17,
-                name="BÓNÁ",
-                meaning="Foundation Strength",
-                description="Solid base and structural integrity",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="σ_max < σ_yield",
-                practical_application="Infrastructure development",
-            ),
-            CosmicPrinciple(
-                id=18,
-                name="DRÍÁ",
-                meaning="Distribution Flow",
-                description="Optimal resource allocation and flow",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="∇·F = ρ",
-                practical_application="Resource management",
-            ),
-            CosmicPrinciple(
-                id=19,
-                name="KÓNÁ",
-                meaning="Sacred Geometry",
-                description="Divine patterns in form and structure",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="V = ∫∫∫ dV",
-                practical_application="Spatial planning",
-            ),
-            CosmicPrinciple(
-                id=20,
-                name="TRÍÁ",
-                meaning="Threefold Unity",
-                description="Trinity principle in manifestation",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="Ψ = ψ₁ + ψ₂ + ψ₃",
-                practical_application="Three-pillar frameworks",
-            ),
-            CosmicPrinciple(
-                id=21,
-                name="MÉNÁ",
-                meaning="Measure Exactness",
-                description="Precise quantification and metrics",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="Δx·Δp ≥ ℏ/2",
-                practical_application="Performance measurement",
-            ),
-            CosmicPrinciple(
-                id=22,
-                name="ÁRÍÁ",
-                meaning="Hierarchical Order",
-                description="Natural ordering and stratification",
-                council_aspect=CouncilAspect.TEMU,
-                mathematical_representation="E₀ < E₁ < E₂ < ...",
-                practical_application="Organizational hierarchy",
-            ),
-            # SEWU Principles (Nurturing, Connection, Community) - 10 principles
-            CosmicPrinciple(
-                id=23,
-                name="HÓTÉ",
-                meaning="Harmonic Integration",
-                description="Coherent integration of diverse elements into unified whole",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="A_harmony = Σ(sin(ωt + φ))",
-                practical_application="Conflict resolution and relationship harmony",
-            ),
-            CosmicPrinciple(
-                id=24,
-                name="LÚVÁ",
-                meaning="Love Resonance",
-                description="Vibrational frequency of unconditional love",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="L(r) = k/r²",
-                practical_application="Compassionate relationships",
-            ),
-            CosmicPrinciple(
-                id=25,
-                name="ÚNÍÁ",
-                meaning="Unity Consciousness",
-                description="Recognition of interconnectedness of all being",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="Ψ_collective = ⨂Ψᵢ",
-                practical_application="Community building",
-            ),
-            CosmicPrinciple(
-                id=26,
-                name="KÁRÉ",
-                meaning="Care Nurturing",
-                description="Tender attention and supportive growth",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="dG/dt = r·G·(1-G/K)",
-                practical_application="Mentorship and support",
-            ),
-            CosmicPrinciple(
-                id=27,
-                name="ÉMÚÁ",
-                meaning="Empathy Bridge",
-                description="Deep understanding and emotional resonance",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="E_shared = ∫ψ₁*·ψ₂ dτ",
-                practical_application="Active listening",
-            ),
-            CosmicPrinciple(
-                id=28,
-                name="SHÁNÁ",
-                meaning="Sharing Flow",
-                description="Generous circulation of resources and wisdom",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="∮ J·dA = 0",
-                practical_application="Knowledge sharing",
-            ),
-            CosmicPrinciple(
-                id=29,
-                name="HÍLÁ",
-                meaning="Healing Presence",
-                description="Restorative energy and therapeutic power",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="H(t) = H₀·e^(-λt)",
-                practical_application="Healing practices",
-            ),
-            CosmicPrinciple(
-                id=30,
-                name="GRÁWÁ",
-                meaning="Growth Cultivation",
-                description="Organic development and evolutionary progress",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="∂u/∂t = D∇²u",
-                practical_application="Personal development",
-            ),
-            CosmicPrinciple(
-                id=31,
-                name="PÉWÁ",
-                meaning="Peace Stillness",
-                description="Tranquil center and harmonious equilibrium",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="∇V = 0",
-                practical_application="Meditation and calm",
-            ),
-            CosmicPrinciple(
-                id=32,
-                name="JÓYÁ",
-                meaning="Joy Radiance",
-                description="Light emanation of happiness and celebration",
-                council_aspect=CouncilAspect.SEWU,
-                mathematical_representation="J = σT⁴",
-                practical_application="Positive environment",
-            ),
-            # RUWA Principles (Vision, Possibility, Innovation) - 10 principles
-            CosmicPrinciple(
-                id=33,
-                name="VÍSÁ",
-                meaning="Vision Sight",
-                description="Clear perception of future possibilities",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="V(future) = ∫P(t)·dt",
-                practical_application="Strategic planning",
-            ),
-            CosmicPrinciple(
-                id=34,
-                name="CRÉÁ",
-                meaning="Creative Force",
-                description="Generative power of imagination and innovation",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="C = ∂Ψ/∂imagination",
-                practical_application="Innovation and creativity",
-            ),
-            CosmicPrinciple(
-                id=35,
-                name="ÉXPÁ",
-                meaning="Expansion Wave",
-                description="Outward growth and boundary transcendence",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="r(t) = r₀·e^(Ht)",
-                practical_application="Market expansion",
-            ),
-            CosmicPrinciple(
-                id=36,
-                name="TRÁNÁ",
-                meaning="Transformation Alchemy",
-                description="Fundamental change and metamorphosis",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="A → B: ΔG < 0",
-                practical_application="Change management",
-            ),
-            CosmicPrinciple(
-                id=37,
-                name="INSÁ",
-                meaning="Insight Flash",
-                description="Sudden illumination and epiphany",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="I(t) = I₀·δ(t-t₀)",
-                practical_application="Breakthrough thinking",
-            ),
-            CosmicPrinciple(
-                id=38,
-                name="PÓSSÁ",
-                meaning="Possibility Field",
-                description="Quantum potential and multiple futures",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="Ψ = Σcᵢ|ψᵢ⟩",
-                practical_application="Scenario planning",
-            ),
-            CosmicPrinciple(
-                id=39,
-                name="IMÁGÁ",
-                meaning="Imagination Power",
-                description="Mental creation and visualization strength",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="I·V = Reality",
-                practical_application="Visioning exercises",
-            ),
-            CosmicPrinciple(
-                id=40,
-                name="NÓVÁ",
-                meaning="Innovation Spark",
-                description="Novel combination and inventive solutions",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="N = recombine(A,B)",
-                practical_application="Product development",
-            ),
-            CosmicPrinciple(
-                id=41,
-                name="FÓRÉÁ",
-                meaning="Foresight Wisdom",
-                description="Anticipatory knowledge and prophetic vision",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="F(t+Δt) = f(state,t)",
-                practical_application="Risk assessment",
-            ),
-            CosmicPrinciple(
-                id=42,
-                name="ÉVÓÁ",
-                meaning="Evolution Drive",
-                description="Progressive development toward higher complexity",
-                council_aspect=CouncilAspect.RUWA,
-                mathematical_representation="dΩ/dt > 0",
-                practical_application="Continuous improvement",
-            ),
-        ]
+        # Shared module-level data, built once at import
+        self.principles: Tuple[CosmicPrinciple, ...] = _PRINCIPLES
+        self.aspect_frameworks: Dict[CouncilAspect, AspectFramework] = _ASPECT_FRAMEWORKS
+        self._decision_cache: "OrderedDict[Tuple[str, bytes], CosmicDecision]" = OrderedDict()
 
-    def _initialize_aspect_frameworks(self) -> Dict[CouncilAspect, Dict]:
-        """Professional Aspect Frameworks"""
-        return {
-            CouncilAspect.SEWU: {
-                "focus": ["nurturing", "connection", "emotional_intelligence", "community"],
-                "questions": [
-                    "How does this nurture growth and relationships?",
-                    "What connections need cultivation?",
-                    "How does this affect communal harmony?",
-                ],
-                "weight": 0.25,
-            },
-            CouncilAspect.PELU: {
-                "focus": ["truth", "boundaries", "integrity", "measurement"],
-                "questions": [
-                    "What is the fundamental truth here?",
-                    "What boundaries ensure integrity?",
-                    "How do we measure accuracy and alignment?",
-                ],
-                "weight": 0.25,
-            },
-            CouncilAspect.RUWA: {
-                "focus": ["vision", "possibility", "innovation", "perspective"],
-                "questions": [
-                    "What future possibilities does this reveal?",
-                    "How can perspective be expanded?",
-                    "What visionary paths are available?",
-                ],
-                "weight": 0.25,
-            },
-            CouncilAspect.TEMU: {
-                "focus": ["structure", "proportion", "timing", "manifestation"],
-                "questions": [
-                    "What structural integrity is needed?",
-                    "How is cosmic proportion maintained?",
-                    "What is the optimal timing for manifestation?",
-                ],
-                "weight": 0.25,
-            },
-        }
+    # The per-aspect lookups derived from that data are built lazily on first use,
+    # so engines that never consult the council don't pay for them
+    @cached_property
+    def _principles_by_aspect(self) -> Dict[CouncilAspect, Tuple[CosmicPrinciple, ...]]:
+        # Single bucketing pass over the principles instead of one filter pass per aspect
+        buckets: Dict[CouncilAspect, List[CosmicPrinciple]] = {aspect: [] for aspect in _ALL_ASPECTS}
+        for principle in self.principles:
+            buckets[principle.council_aspect].append(principle)
+        return {aspect: tuple(principles) for aspect, principles in buckets.items()}
 
-    async def consult_council(self, question: str, context: Dict[str, Any] = None) -> CosmicDecision:
-        """Professional Council Consultation"""
-        if context is None:
-            context = {}
-
-        # Concurrent aspect analysis
-        tasks = [self._analyze_aspect(question, aspect, context) for aspect in CouncilAspect]
-        perspectives = await asyncio.gather(*tasks)
-
-        # Synthesize decision
-        return self._synthesize_decision(perspectives, question)
+    @cached_property
+    def _names_by_aspect(self) -> Dict[CouncilAspect, Tuple[str, ...]]:
+        # Names only, so per-aspect name reads are a tuple slice with no attribute access
+        return {aspect: tuple(p.name for p in principles) for aspect, principles in self._principles_by_aspect.items()}
 
-    async def _analyze_aspect(self, question: str, aspect: CouncilAspect, context: Dict) -> CouncilPerspective:
-        """Professional Aspect Analysis"""
-        framework = self.aspect_frameworks[aspect]
-        principles = [p for p in self.principles if p.council_aspect == aspect]
+    @cached_property
+    def _static_aspect_strings(self) -> Dict[CouncilAspect, Tuple[str, str, str, Tuple[str, ...]]]:
+        # (perspective, reasoning, recommendation, principles_applied) depend only on the aspect
+        return {aspect: self._build_aspect_strings(aspect) for aspect in _ALL_ASPECTS}
 
-        # Simulate AI reasoning
-        perspective = f"{aspect.value.upper()} analyzes through {framework['focus']}"
-        reasoning = f"Considering: {' | '.join(framework['questions'])}"
-        recommendation = f"Apply principles: {[p.name for p in principles[:2]]}"
+    @cached_property
+    def _template_perspectives(self) -> Dict[CouncilAspect, CouncilPerspective]:
+        return {aspect: self._build_perspective(aspect) for aspect in _ALL_ASPECTS}
 
+    def _build_perspective(self, aspect: CouncilAspect) -> CouncilPerspective:
+        """Build the immutable perspective shared by every consultation"""
+        perspective, reasoning, recommendation, top2_names = self._static_aspect_strings[aspect]
         return CouncilPerspective(
             aspect=aspect,
             perspective=perspective,
             reasoning=reasoning,
             recommendation=recommendation,
-            principles_applied=[p.name for p in principles[:2]],
+            principles_applied=top2_names,
             coherence_score=0.85,
         )
 
-    def _synthesize_decision(self, perspectives: List[CouncilPerspective], question: str) -> CosmicDecision:
-        """Professional Decision Synthesis"""
-        perspectives_dict = {p.aspect: p for p in perspectives}
+    def _build_aspect_strings(self, aspect: CouncilAspect) -> Tuple[str, str, str, Tuple[str, ...]]:
+        """Render the question-independent parts of an aspect's perspective"""
+        framework = self.aspect_frameworks[aspect]
+        top2_names = self._names_by_aspect[aspect][:2]
+
+        # Simulate AI reasoning
+        perspective = f"{aspect.upper_name} analyzes through {list(framework.focus)}"
+        reasoning = f"Considering: {' | '.join(framework.questions)}"
+        recommendation = f"Apply principles: {list(top2_names)}"
+        return perspective, reasoning, recommendation, top2_names
+
+    async def consult_council(self, question: str, context: Dict[str, Any] = None) -> CosmicDecision:
+        """Professional Council Consultation"""
+        if context is None:
+            context = {}
+
+        # Decisions are deterministic in (question, context), so repeat consultations are served from cache
+        # Context is canonicalised as sorted-key JSON so nested values share entries too, and
+        # kept only as a fixed-size digest so large request bodies don't stay resident
+        try:
+            key = (question, _context_digest(context) if context else b"")
+        except (TypeError, ValueError):  # not JSON-serialisable - skip the cache
+            key = None
+        decision = self._decision_cache.get(key) if key is not None else None
+        if decision is not None:
+            self._decision_cache.move_to_end(key)
+            return _detach(decision)
+
+        # Aspect analysis is pure CPU work with no awaits, so run it inline
+        perspectives = {aspect: self._analyze_aspect(question, aspect, context) for aspect in _ALL_ASPECTS}
+
+        # Synthesize decision
+        decision = self._synthesize_decision(perspectives, question)
+        if key is not None:
+            self._decision_cache[key] = decision
+            if len(self._decision_cache) > _DECISION_CACHE_SIZE:
+                self._decision_cache.popitem(last=False)
+        return _detach(decision)
+
+    def _analyze_aspect(self, question: str, aspect: CouncilAspect, context: Dict) -> CouncilPerspective:
+        """Professional Aspect Analysis"""
+        # Perspectives don't yet vary with question/context; use dataclasses.replace on the
+        # template for any field that does once they do
+        return self._template_perspectives[aspect]
 
+    def _synthesize_decision(self, perspectives: Dict[CouncilAspect, CouncilPerspective], question: str) -> CosmicDecision:
+        """Professional Decision Synthesis"""
         # Calculate metrics
-        coherence = sum(p.coherence_score for p in perspectives) / len(perspectives)
+        coherence = sum(p.coherence_score for p in perspectives.values()) / _ASPECT_COUNT
         consensus = 0.75  # Simulated consensus
 
         # Generate integrated decision
-        integrated = self._generate_integrated_decision(perspectives_dict, question)
-        actions = self._generate_actions(perspectives_dict)
+        integrated = self._generate_integrated_decision(perspectives, question)
+        actions = self._generate_actions(perspectives)
 
         return CosmicDecision(
             integrated_decision=integrated,
-            council_perspectives=perspectives_dict,
+            council_perspectives=perspectives,
             consensus_level=consensus,
             cosmic_coherence=coherence,
             recommended_actions=actions,
@@ -536,22 +637,48 @@ class BenkhawiyaEngine:
 
     def _generate_integrated_decision(self, perspectives: Dict[CouncilAspect, CouncilPerspective], question: str) -> str:
         """Professional Decision Integration"""
-        aspects_summary = " | ".join(
-            [f"{aspect.value.upper()}: {perspective.recommendation[:50]}..." for aspect, perspective in perspectives.items()]
-        )
-        return f"COSMIC DECISION: {question} → Integrated wisdom: {aspects_summary}"
-
-    def _generate_actions(self, perspectives: Dict[CouncilAspect, CouncilPerspective]) -> List[str]:
-        """Professional Action Generation"""
-        return [
-            f"Apply {aspect.value} wisdom: {perspective.recommendation[:60]}..."
+        parts = [
+            _DECISION_PREFIXES[aspect] + perspective.recommendation[:50] + "..."
             for aspect, perspective in perspectives.items()
         ]
+        return f"COSMIC DECISION: {question} → Integrated wisdom: {' | '.join(parts)}"
+
+    def _generate_actions(self, perspectives: Dict[CouncilAspect, CouncilPerspective]) -> Tuple[str, ...]:
+        """Professional Action Generation"""
+        return tuple(
+            _ACTION_PREFIXES[aspect] + perspective.recommendation[:60] + "..." for aspect, perspective in perspectives.items()
+        )
 
     def calculate_golden_progression(self, n: int) -> float:
         """Φ-based Developmental Mathematics"""
-        return self.phi**n
+        if isinstance(n, int) and 0 <= n < len(_PHI_POWERS):
+            return _PHI_POWERS[n]
+        return math.pow(PHI, n)
 
-    def get_principles_by_aspect(self, aspect: CouncilAspect) -> List[CosmicPrinciple]:
+    def calculate_golden_progression_batch(self, ns) -> np.ndarray:
+        """Φ-based progression for many developmental stages at once"""
+        arr = np.asarray(ns, dtype=np.float64)
+        return _kernels.phi_pow_batch(arr.ravel(), PHI).reshape(arr.shape)
+
+    def get_principles_by_aspect(self, aspect: CouncilAspect) -> Tuple[CosmicPrinciple, ...]:
         """Get principles by council aspect"""
-        return [p for p in self.principles if p.council_aspect == aspect]
+        return self._principles_by_aspect[aspect]
+
+    def get_principles_payload(self, aspect: CouncilAspect = None) -> bytes:
+        """Get the encoded /principles response body (all principles when aspect is None)"""
+        return self._principles_payloads[aspect]
+
+    @cached_property
+    def _principles_payloads(self) -> Dict[Optional[CouncilAspect], bytes]:
+        # Pre-encoded once; immutable bytes can be shared by every request
+        groups = {None: self.principles, **self._principles_by_aspect}
+        return {
+            aspect: orjson.dumps(
+                {
+                    "count": len(principles),
+                    "aspect": aspect.value if aspect else "all",
+                    "principles": [asdict(p) for p in principles],
+                }
+            )
+            for aspect, principles in groups.items()
+        }
@@ -3,39 +3,75 @@ BENKHAWIYA AI - PROFESSIONAL COSMIC REASONING API
 Deployable to sacredtreeofthephoenix.org
 """
 
-from fastapi import FastAPI, HTTPException, Depends, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
+from fastapi import FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.templating import Jinja2Templates
 from contextlib import asynccontextmanager
 import logging
+import orjson
 import os
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 from pathlib import Path
 
+from app.core import _kernels
 from app.core.cosmic_engine import BenkhawiyaEngine, CouncilAspect, CosmicDecision
+from app.middleware import OpenCORSMiddleware
 
 # Professional logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Questions are echoed into the decision text, so bound them before they reach the engine
+MAX_QUESTION_LENGTH = 1024
+
 # Templates
 templates = Jinja2Templates(directory=str(Path(__file__).parent / "templates"))
+# The index page has no per-request content, so it is rendered once up front
+INDEX_HTML_BYTES = templates.get_template("index.html").render({"request": None}).encode()
+
+# Favicon is read once so requests don't stat/open the file
+_favicon_path = Path(__file__).parent / "static" / "favicon.ico"
+FAVICON_BYTES = _favicon_path.read_bytes() if _favicon_path.exists() else None
+
+
+def _render_status_payloads(engine: BenkhawiyaEngine = None) -> Tuple[bytes, bytes]:
+    """Pre-encode the /api and /health bodies; they only change with the engine state"""
+    api_info = {
+        "system": "Benkhawiya AI - Cosmic Reasoning System",
+        "version": "2.0.0",
+        "status": "operational" if engine else "degraded",
+        "domain": "sacredtreeofthephoenix.org",
+        "features": {"council_reasoning": True, "cosmic_principles": True, "golden_ratio_mathematics": True},
+    }
+    health = {
+        "status": "healthy" if engine else "degraded",
+        "components": {
+            "cosmic_engine": engine is not None,
+            "principles_loaded": len(engine.principles) if engine else 0,
+        },
+    }
+    return orjson.dumps(api_info), orjson.dumps(health)
+
 
-# Global engine instance
-cosmic_engine = None
+API_INFO_BYTES, HEALTH_BYTES = _render_status_payloads(None)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global cosmic_engine
+    global API_INFO_BYTES, HEALTH_BYTES
     logger.info("🌌 INITIALIZING BENKHAWIYA COSMIC REASONING SYSTEM")
     try:
-        cosmic_engine = BenkhawiyaEngine()
+        app.state.engine = BenkhawiyaEngine()
         logger.info("✅ Cosmic engine initialized successfully")
     except Exception as e:
         logger.error(f"❌ Failed to initialize cosmic engine: {e}")
-        cosmic_engine = None
+        app.state.engine = None
+    try:
+        # Pay Numba JIT compilation (or cache load) here rather than on the first request
+        _kernels.warmup()
+    except Exception as e:
+        logger.warning(f"⚠️ Numeric kernel warmup failed, compiling on first use instead: {e}")
+    API_INFO_BYTES, HEALTH_BYTES = _render_status_payloads(app.state.engine)
     yield
     logger.info("🛑 Benkhawiya AI system shutting down")
 
@@ -44,82 +80,66 @@ app = FastAPI(
     title="Benkhawiya AI - Cosmic Reasoning System",
     description="Professional implementation for sacredtreeofthephoenix.org",
     version="2.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
+app.state.engine = None
 
-# CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# CORS middleware (allow all origins, methods and headers)
+app.add_middleware(OpenCORSMiddleware)
 
 
-def get_cosmic_engine() -> BenkhawiyaEngine:
-    if cosmic_engine is None:
+def get_cosmic_engine(request: Request) -> BenkhawiyaEngine:
+    # Called directly rather than through Depends to skip FastAPI's per-request dependency resolution
+    engine = request.app.state.engine
+    if engine is None:
         raise HTTPException(status_code=503, detail="Cosmic reasoning engine unavailable")
-    return cosmic_engine
+    return engine
 
 
 @app.get("/", response_class=HTMLResponse)
-async def root(request: Request):
+async def root():
     """Serve the web UI"""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(content=INDEX_HTML_BYTES)
 
 
 @app.get("/api", response_model=Dict[str, Any])
 async def api_root():
     """API information endpoint"""
-    return {
-        "system": "Benkhawiya AI - Cosmic Reasoning System",
-        "version": "2.0.0",
-        "status": "operational" if cosmic_engine else "degraded",
-        "domain": "sacredtreeofthephoenix.org",
-        "features": {"council_reasoning": True, "cosmic_principles": True, "golden_ratio_mathematics": True},
-    }
+    return Response(content=API_INFO_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health_check():
-    return {
-        "status": "healthy" if cosmic_engine else "degraded",
-        "components": {
-            "cosmic_engine": cosmic_engine is not None,
-            "principles_loaded": len(cosmic_engine.principles) if cosmic_engine else 0,
-        },
-    }
+    return Response(content=HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/principles")
-async def get_cosmic_principles(
-    aspect: CouncilAspect = None, engine: BenkhawiyaEngine = Depends(get_cosmic_engine)
-) -> JSONResponse:
-    principles = engine.get_principles_by_aspect(aspect) if aspect else engine.principles
-    content = {
-        "count": len(principles),
-        "aspect": aspect.value if aspect else "all",
-        "principles": [principle.model_dump() for principle in principles],
-    }
-    return JSONResponse(content=content, media_type="application/json; charset=utf-8")
+async def get_cosmic_principles(request: Request, aspect: CouncilAspect = None) -> Response:
+    engine = get_cosmic_engine(request)
+    return Response(content=engine.get_principles_payload(aspect), media_type="application/json; charset=utf-8")
 
 
-@app.post("/council/consult", response_model=CosmicDecision)
+@app.post("/council/consult", response_model=CosmicDecision, response_class=ORJSONResponse)
 async def consult_council(
-    question: str, context: Dict[str, Any] = None, engine: BenkhawiyaEngine = Depends(get_cosmic_engine)
-) -> CosmicDecision:
+    request: Request, question: str = Query(..., max_length=MAX_QUESTION_LENGTH), context: Dict[str, Any] = None
+) -> ORJSONResponse:
+    engine = get_cosmic_engine(request)
     try:
         decision = await engine.consult_council(question, context)
         logger.info(f"Council consultation completed: {question[:50]}...")
-        return decision
+        # Engine output is trusted; returning a response directly skips re-validating
+        # every council_perspectives key/value against response_model. orjson encodes
+        # the dataclass natively, so no intermediate dict is built either
+        return ORJSONResponse(content=decision)
     except Exception as e:
         logger.error(f"Council consultation failed: {e}")
         raise HTTPException(status_code=500, detail=f"Cosmic reasoning failed: {str(e)}")
 
 
 @app.get("/mathematics/golden-ratio/{n}")
-async def calculate_golden_progression(n: int, engine: BenkhawiyaEngine = Depends(get_cosmic_engine)) -> Dict[str, Any]:
+async def calculate_golden_progression(request: Request, n: int) -> Dict[str, Any]:
+    engine = get_cosmic_engine(request)
     if n < 0 or n > 100:
         raise HTTPException(status_code=400, detail="n must be between 0 and 100")
 
@@ -136,15 +156,28 @@ async def calculate_golden_progression(n: int, engine: BenkhawiyaEngine = Depend
 @app.get("/favicon.ico", include_in_schema=False)
 async def favicon():
     """Serve the favicon.ico file"""
-    favicon_path = Path(__file__).parent / "static" / "favicon.ico"
-    if favicon_path.exists():
-        return FileResponse(favicon_path, media_type="image/x-icon")
-    raise HTTPException(status_code=404, detail="Favicon not found")
+    if FAVICON_BYTES is None:
+        raise HTTPException(status_code=404, detail="Favicon not found")
+    return Response(
+        content=FAVICON_BYTES,
+        media_type="image/x-icon",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
 
 
 if __name__ == "__main__":
     import uvicorn
 
     port = int(os.getenv("PORT", 8000))
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
     # Bind to 0.0.0.0 for deployment on cloud platforms (Railway, Heroku, etc.)
-    uvicorn.run(app, host="0.0.0.0", port=port)  # nosec B104
+    # loop/http "auto" pick uvloop and httptools from uvicorn[standard] where they are installed
+    # (uvloop is not on Windows); multiple workers need the import string
+    uvicorn.run(
+        app if workers == 1 else "app.main:app",
+        host="0.0.0.0",  # nosec B104
+        port=port,
+        loop="auto",
+        http="auto",
+        workers=workers,
+    )
@@ -0,0 +1,64 @@
+"""
+BENKHAWIYA AI - ASGI MIDDLEWARE
+Lightweight replacements for generic Starlette middleware
+"""
+
+_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+# Appended to every HTTP response - the policy is wide open, so there is nothing to match
+_CORS_HEADERS = [
+    (b"access-control-allow-origin", b"*"),
+    (b"access-control-allow-credentials", b"true"),
+]
+
+
+class OpenCORSMiddleware:
+    """Wide-open CORS policy without per-request origin/method/header matching"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope["headers"])
+        origin = headers.get(b"origin")
+        if scope["method"] == "OPTIONS" and origin is not None and b"access-control-request-method" in headers:
+            await self._preflight(headers, send)
+            return
+
+        cors_headers = _CORS_HEADERS
+        if origin is not None and b"cookie" in headers:
+            # Browsers reject "*" alongside credentials, so credentialed requests get their origin echoed
+            cors_headers = [
+                (b"access-control-allow-origin", origin),
+                (b"access-control-allow-credentials", b"true"),
+                (b"vary", b"Origin"),
+            ]
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    @staticmethod
+    async def _preflight(headers, send):
+        # Credentialed preflights must echo the origin rather than answer "*"
+        response_headers = [
+            (b"access-control-allow-origin", headers[b"origin"]),
+            (b"access-control-allow-methods", _ALLOW_METHODS),
+            (b"access-control-allow-credentials", b"true"),
+            (b"access-control-max-age", b"600"),
+            (b"vary", b"Origin"),
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", b"2"),
+        ]
+        requested_headers = headers.get(b"access-control-request-headers")
+        if requested_headers:
+            response_headers.append((b"access-control-allow-headers", requested_headers))
+        await send({"type": "http.response.start", "status": 200, "headers": response_headers})
+        await send({"type": "http.response.body", "body": b"OK"})
@@ -0,0 +1,82 @@
+"""
+Cosmic engine tests
+"""
+
+import asyncio
+
+import pytest
+
+from app.core import cosmic_engine
+from app.core.cosmic_engine import BenkhawiyaEngine, CouncilAspect
+
+
+def consult(engine, question, context=None):
+    return asyncio.run(engine.consult_council(question, context))
+
+
+@pytest.fixture
+def engine():
+    return BenkhawiyaEngine()
+
+
+def test_decision_ignores_context(engine):
+    # The decision cache relies on perspectives depending on neither question nor context
+    plain = consult(engine, "How should we proceed?")
+    with_context = consult(engine, "How should we proceed?", {"project": "phoenix", "tags": ["a", "b"]})
+
+    assert with_context == plain
+    assert consult(engine, "Another question?").council_perspectives == plain.council_perspectives
+
+
+def test_repeat_question_is_served_from_cache(engine):
+    first = consult(engine, "q", {"b": [1, 2], "a": {"c": 3}})
+    second = consult(engine, "q", {"a": {"c": 3}, "b": [1, 2]})
+
+    assert second == first
+    assert len(engine._decision_cache) == 1
+
+
+def test_different_questions_get_different_decisions(engine):
+    first = consult(engine, "first question")
+    second = consult(engine, "second question")
+
+    assert first.integrated_decision != second.integrated_decision
+    assert len(engine._decision_cache) == 2
+
+
+def test_unserialisable_context_bypasses_cache(engine):
+    consult(engine, "q", {"value": object()})
+
+    assert len(engine._decision_cache) == 0
+
+
+def test_mutating_a_decision_does_not_leak_into_cache(engine):
+    first = consult(engine, "q1")
+    first.council_perspectives.clear()
+
+    repeat = consult(engine, "q1")
+    assert set(repeat.council_perspectives) == set(CouncilAspect)
+    assert len(repeat.recommended_actions) == len(CouncilAspect)
+    assert isinstance(repeat.recommended_actions, tuple)
+    assert isinstance(repeat.council_perspectives[CouncilAspect.SEWU].principles_applied, tuple)
+
+
+def test_cache_evicts_least_recently_used(engine, monkeypatch):
+    monkeypatch.setattr(cosmic_engine, "_DECISION_CACHE_SIZE", 3)
+
+    for question in ("q1", "q2", "q3"):
+        consult(engine, question)
+    consult(engine, "q1")  # refresh q1 so q2 becomes the oldest entry
+    consult(engine, "q4")
+
+    cached_questions = [question for question, _ in engine._decision_cache]
+    assert cached_questions == ["q3", "q1", "q4"]
+
+
+def test_golden_progression_batch_keeps_shape(engine):
+    stages = [[0, 1, 2], [3, 4, 10]]
+    result = engine.calculate_golden_progression_batch(stages)
+
+    assert result.shape == (2, 3)
+    assert result[1, 2] == pytest.approx(engine.calculate_golden_progression(10))
+    assert engine.calculate_golden_progression_batch(5).shape == ()
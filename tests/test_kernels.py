@@ -0,0 +1,16 @@
+"""
+Numeric kernel tests
+"""
+
+import math
+
+import pytest
+
+from app.core import _kernels
+
+
+@pytest.mark.parametrize("omega, t, phi, n_terms", [(1.0, 0.5, 0.0, 10), (2.5, 1.3, 0.7, 25), (1.0, 1.0, 0.0, 0)])
+def test_harmonic_sum_matches_python(omega, t, phi, n_terms):
+    expected = sum(math.sin(k * omega * t + phi) for k in range(1, n_terms + 1))
+
+    assert _kernels.harmonic_sum(omega, t, phi, n_terms) == pytest.approx(expected)
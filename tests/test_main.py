@@ -0,0 +1,78 @@
+"""
+API tests
+"""
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.core.cosmic_engine import CouncilAspect
+
+
+@pytest.fixture
+def client():
+    with TestClient(main.app) as client:
+        yield client
+
+
+def test_failed_kernel_warmup_keeps_engine_available(monkeypatch):
+    def broken_warmup():
+        raise RuntimeError("cannot write numba cache")
+
+    monkeypatch.setattr(main._kernels, "warmup", broken_warmup)
+    with TestClient(main.app) as client:
+        health = client.get("/health").json()
+        assert health["status"] == "healthy"
+        assert health["components"]["principles_loaded"] == 42
+        assert client.post("/council/consult", params={"question": "Still there?"}).status_code == 200
+
+
+def test_principles_payload_is_not_mutable_through_the_engine(client):
+    engine = main.app.state.engine
+    payload = engine.get_principles_payload(CouncilAspect.SEWU)
+    assert isinstance(payload, bytes)
+
+    tampered = orjson.loads(payload)
+    tampered["principles"][0]["name"] = "HACKED"
+    tampered["principles"].pop()
+
+    body = client.get("/principles", params={"aspect": "sewu"}).json()
+    sewu = engine.get_principles_by_aspect(CouncilAspect.SEWU)
+    assert body["count"] == len(sewu)
+    assert [p["name"] for p in body["principles"]] == [p.name for p in sewu]
+
+
+def test_principles_filtered_and_unfiltered_views_agree(client):
+    everything = client.get("/principles").json()
+    assert everything["aspect"] == "all"
+    assert everything["count"] == 42
+
+    for aspect in CouncilAspect:
+        body = client.get("/principles", params={"aspect": aspect.value}).json()
+        assert body["aspect"] == aspect.value
+        assert body["principles"] == [p for p in everything["principles"] if p["council_aspect"] == aspect.value]
+
+
+def test_consult_accepts_question_at_length_limit(client):
+    assert main.MAX_QUESTION_LENGTH == 1024
+    question = "x" * main.MAX_QUESTION_LENGTH
+
+    response = client.post("/council/consult", params={"question": question})
+
+    assert response.status_code == 200
+    assert response.json()["integrated_decision"].startswith(f"COSMIC DECISION: {question} ")
+
+
+def test_consult_rejects_oversized_question_before_engine_runs(client, monkeypatch):
+    calls = []
+
+    async def recording_consult(question, context=None):
+        calls.append(question)
+
+    monkeypatch.setattr(main.app.state.engine, "consult_council", recording_consult)
+
+    response = client.post("/council/consult", params={"question": "x" * (main.MAX_QUESTION_LENGTH + 1)})
+
+    assert response.status_code == 422
+    assert calls == []
@@ -0,0 +1,101 @@
+"""
+CORS middleware tests
+"""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.middleware import OpenCORSMiddleware
+
+ORIGIN = "http://x.com"
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(OpenCORSMiddleware)
+
+    @app.get("/ping")
+    async def ping():
+        return {"pong": True}
+
+    return TestClient(app)
+
+
+def cors_headers(response):
+    return {k: v for k, v in response.headers.items() if k.startswith("access-control-") or k == "vary"}
+
+
+def test_preflight_echoes_origin(client):
+    response = client.options("/ping", headers={"Origin": ORIGIN, "Access-Control-Request-Method": "POST"})
+
+    assert response.status_code == 200
+    assert response.text == "OK"
+    assert cors_headers(response) == {
+        "access-control-allow-origin": ORIGIN,
+        "access-control-allow-methods": "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT",
+        "access-control-allow-credentials": "true",
+        "access-control-max-age": "600",
+        "vary": "Origin",
+    }
+
+
+def test_preflight_echoes_requested_headers(client):
+    response = client.options(
+        "/ping",
+        headers={
+            "Origin": ORIGIN,
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "content-type, x-custom",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-headers"] == "content-type, x-custom"
+    assert response.headers["access-control-allow-origin"] == ORIGIN
+    assert response.headers["vary"] == "Origin"
+
+
+def test_simple_request_without_cookie_allows_any_origin(client):
+    response = client.get("/ping", headers={"Origin": ORIGIN})
+
+    assert response.json() == {"pong": True}
+    assert cors_headers(response) == {
+        "access-control-allow-origin": "*",
+        "access-control-allow-credentials": "true",
+    }
+
+
+def test_simple_request_with_cookie_echoes_origin(client):
+    response = client.get("/ping", headers={"Origin": ORIGIN, "Cookie": "session=abc"})
+
+    assert response.json() == {"pong": True}
+    assert cors_headers(response) == {
+        "access-control-allow-origin": ORIGIN,
+        "access-control-allow-credentials": "true",
+        "vary": "Origin",
+    }
+
+
+def test_non_http_scope_passes_through_untouched():
+    received = []
+    sent = []
+
+    async def inner_app(scope, receive, send):
+        received.append(scope)
+        await send({"type": "websocket.accept", "headers": [(b"x-inner", b"1")]})
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "websocket.connect"}
+
+    scope = {"type": "websocket", "headers": [(b"origin", ORIGIN.encode())]}
+    asyncio.run(OpenCORSMiddleware(inner_app)(scope, receive, send))
+
+    assert received == [scope]
+    assert sent == [{"type": "websocket.accept", "headers": [(b"x-inner", b"1")]}]